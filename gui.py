@@ -58,12 +58,8 @@ class MacroGUI:
 
     def set_up_widgets(self) -> None:
         """Initializes and places main UI components (Record + Play buttons)."""
-        self.record_img = self.load_image("record.png")
-        self.play_img = self.load_image("play.png")
-
         record_button = tk.Button(
             self.master,
-            image=self.record_img,
             text="Record",
             font=("Arial", 20),
             compound="top",
@@ -73,7 +69,6 @@ class MacroGUI:
 
         play_button = tk.Button(
             self.master,
-            image=self.play_img,
             text="Play",
             font=("Arial", 20),
             compound="top",
@@ -83,23 +78,54 @@ class MacroGUI:
 
         self.buttons = [record_button, play_button]
 
-    def load_image(self, filename: str) -> PhotoImage | None:
+        # Buttons appear immediately with text labels; image bytes are read
+        # on a worker thread so startup is not blocked on file I/O.
+        threading.Thread(target=self.load_images, daemon=True).start()
+
+    def read_asset(self, filename: str) -> bytes | None:
         """
-        Loads a PhotoImage from the assets folder.
+        Reads an image file from the assets folder as raw bytes.
 
         Args:
             filename (str): Name of the image file.
 
         Returns:
-            PhotoImage | None: Loaded image, or None if missing.
+            bytes | None: File contents, or None if missing.
         """
         path = Path.cwd() / "assets" / filename
         if path.exists():
-            return PhotoImage(file=str(path))
+            return path.read_bytes()
 
         logger.warning("Asset not found: %s", filename)
         return None
 
+    def load_images(self) -> None:
+        """
+        Reads the button images and schedules their attachment.
+
+        Runs on a worker thread; PhotoImage construction is deferred to the
+        main thread via after() since only it may touch Tk objects.
+        """
+        record_bytes = self.read_asset("record.png")
+        play_bytes = self.read_asset("play.png")
+        self.master.after(0, self.apply_images, record_bytes, play_bytes)
+
+    def apply_images(self, record_bytes: bytes | None,
+                     play_bytes: bytes | None) -> None:
+        """
+        Constructs PhotoImages on the main thread and attaches them.
+
+        Args:
+            record_bytes (bytes | None): Raw PNG data for the Record button.
+            play_bytes (bytes | None): Raw PNG data for the Play button.
+        """
+        if record_bytes:
+            self.record_img = PhotoImage(data=record_bytes)
+            self.buttons[0].config(image=self.record_img)
+        if play_bytes:
+            self.play_img = PhotoImage(data=play_bytes)
+            self.buttons[1].config(image=self.play_img)
+
     def shutdown(self) -> None:
         """
         Handles window close event.
@@ -154,7 +180,9 @@ class MacroGUI:
             self.update_status("Recording...")
             recorder.start_recording()
 
-            self.master.after(0, self.save_recording, recorder.events)
+            # Events are slotted records; flatten to dicts for serialization.
+            events = [event.to_dict() for event in recorder.events]
+            self.master.after(0, self.save_recording, events)
 
         except Exception:  # pylint: disable=broad-exception-caught
             logger.exception("Recording failed due to an unexpected error")
@@ -227,12 +255,16 @@ class MacroGUI:
             player = MacroPlayer(status=status)
             self.update_status(f"Loading: {self.current_macro}")
 
+            # Compile the recording now so the countdown overlaps the
+            # precompilation work and playback starts the moment it ends.
+            player.compile_actions(data)
+
             for i in range(3, 0, -1):
                 status(f"Starting in {i}")
                 sleep(1)
 
             status("Playing")
-            player.start_playback(data)
+            player.start_playback()
 
             if player.playback_thread and player.playback_thread.is_alive():
                 player.playback_thread.join()
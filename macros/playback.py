@@ -1,13 +1,15 @@
 """
-This module replays recorded keyboard and mouse events using pyautogui with precise 
-timing and pause/resume support. 
+This module replays recorded keyboard and mouse events with precise timing and
+pause/resume support. On Windows, events are dispatched directly through the
+Win32 SendInput API (see macros/win_input.py) to avoid pyautogui's per-call
+overhead; other platforms fall back to pyautogui.
 
 Classes:
     MacroPlayer: Engine for executing recorded events with high temporal accuracy.
 """
 
 import logging
-import queue
+import sys
 import threading
 import time
 from typing import Callable, Dict, List, Optional, Any
@@ -17,15 +19,39 @@ import pyautogui
 
 from utils.mappings import key_map, mouse_button_map
 
+if sys.platform == "win32":
+    from macros import win_input
+else:
+    win_input = None
+
 logger = logging.getLogger("playback")
 
+# Integer opcodes for compiled actions: comparing small ints in the
+# playback loop is cheaper than hashing the recorded type strings.
+OP_KEY = 0
+OP_MOUSE = 1
+OP_MOVE = 2
+OP_SCROLL = 3
+
+OP_NAMES = ("key", "mouse button", "mouse move", "scroll")
+
+OPCODE_MAP = {
+    "keyDown": OP_KEY,
+    "keyUp": OP_KEY,
+    "mouseDown": OP_MOUSE,
+    "mouseUp": OP_MOUSE,
+    "mouseMove": OP_MOVE,
+    "scroll": OP_SCROLL,
+}
+
 
 class MacroPlayer:
     """
     Executes recorded keyboard and mouse inputs.
 
-    Runs input listeners on background threads and processes events
-    through a synchronized queue to ensure thread-safe recording.
+    Recorded actions are compiled once into parallel offset/opcode/payload
+    lists before playback starts, so the timing-critical loop performs no
+    type dispatch, dict access, or key translation.
 
     Supports pause/resume with timestamp correction so recorded
     event timing remains consistent across pauses.
@@ -35,6 +61,9 @@ class MacroPlayer:
     SCROLL_MULTIPLIER = 120
     MIN_DELAY_THRESHOLD = 0.005
     PAUSE_COOLDOWN = 3  # seconds to ignore pause/resume
+    # Mouse moves bracketed by neighboring moves within this window are
+    # dropped at compile time; endpoints are always preserved.
+    MOVE_COALESCE_WINDOW = 0.005  # seconds
 
     def __init__(self, status: Optional[Callable[[str], None]] = None) -> None:
         """
@@ -47,7 +76,9 @@ class MacroPlayer:
         pyautogui.FAILSAFE = True
         pyautogui.PAUSE = 0.0
 
-        self.action_queue = queue.Queue()
+        self._offsets: list = []
+        self._ops: list = []
+        self._payloads: list = []
         self.pause_event = threading.Event()
         self.pause_event.set()
 
@@ -61,31 +92,80 @@ class MacroPlayer:
 
         self.status = status
 
-        self.handlers = {
-            "keyDown": self.handle_key,
-            "keyUp": self.handle_key,
-            "mouseDown": self.handle_mouse,
-            "mouseUp": self.handle_mouse,
-            "mouseMove": self.handle_mouse_move,
-            "scroll": self.handle_scroll,
-        }
-
-    def start_playback(self, actions: List[Dict[str, Any]]) -> None:
+        # Cached level check so handlers skip logging calls entirely when
+        # DEBUG output is off; refreshed when playback starts.
+        self._debug = logger.isEnabledFor(logging.DEBUG)
+
+        # SendInput fast path: prefilled INPUT templates reused across
+        # dispatches, and a cache of resolved (vk, scan, flags) per key.
+        self.use_sendinput = win_input is not None
+        self._timer_handle = None
+        self._hotkey_thread = None
+        self._hotkey_thread_id = None
+        if self.use_sendinput:
+            # Prefilled INPUT arrays keyed by event signature: repeated
+            # events reuse a static template instead of re-marshalling
+            # every struct field through ctypes descriptors.
+            self._input_cache: Dict[tuple, Any] = {}
+            self._scan_cache: Dict[str, Optional[tuple]] = {}
+            self._timer_handle = win_input.create_timer()
+            # Held-key bookkeeping as a 256-bit bitmap indexed by VK code:
+            # bit test/set instead of string hashing per event.
+            self._pressed_bitmap = bytearray(32)
+            # Reusable buffers for absolute-coordinate mouse input. The
+            # chord buffer holds an ABSOLUTE move plus a button transition
+            # dispatched as one SendInput call.
+            self._screen_w, self._screen_h = win_input.screen_size()
+            self._move_buffer = (win_input.INPUT * 1)()
+            self._move_buffer[0].type = win_input.INPUT_MOUSE
+            self._move_buffer[0].mi.dwFlags = (
+                win_input.MOUSEEVENTF_MOVE | win_input.MOUSEEVENTF_ABSOLUTE)
+            self._chord_buffer = (win_input.INPUT * 2)()
+            self._chord_buffer[0].type = win_input.INPUT_MOUSE
+            self._chord_buffer[0].mi.dwFlags = (
+                win_input.MOUSEEVENTF_MOVE | win_input.MOUSEEVENTF_ABSOLUTE)
+            self._chord_buffer[1].type = win_input.INPUT_MOUSE
+
+    def start_playback(self, actions: Optional[List[Dict[str, Any]]] = None) -> None:
         """
         Start playback of recorded macro actions.
 
         Args:
-            actions: List of recorded events.
+            actions: List of recorded events. May be omitted if
+                compile_actions was already called, e.g. during the GUI
+                countdown so compilation overlaps the wait.
         """
+        self._debug = logger.isEnabledFor(logging.DEBUG)
         self.start_pause_listener()
-        self.load_event(actions)
+        if actions is not None:
+            self.compile_actions(actions)
 
         self.playback_thread = threading.Thread(target=self.playback_loop)
         self.playback_thread.start()
 
     def start_pause_listener(self) -> None:
-        """Register hotkey used to pause and resume playback."""
-        keyboard.add_hotkey(self.PAUSE_KEY, self.toggle_pause, suppress=True)
+        """
+        Register the hotkey used to pause and resume playback.
+
+        On Windows a dedicated message-pump thread receives WM_HOTKEY via
+        RegisterHotKey, avoiding the global low-level keyboard hook the
+        keyboard library installs, which adds latency to every keystroke
+        during playback. Other platforms keep the keyboard-library hotkey.
+        """
+        if self.use_sendinput:
+            self._hotkey_thread = threading.Thread(
+                target=self.hotkey_loop, daemon=True)
+            self._hotkey_thread.start()
+        else:
+            keyboard.add_hotkey(
+                self.PAUSE_KEY, self.toggle_pause, suppress=True)
+
+    def hotkey_loop(self) -> None:
+        """Message pump for the pause hotkey (Windows only)."""
+        self._hotkey_thread_id = win_input.current_thread_id()
+        if not win_input.pump_hotkey(win_input.VK_PAUSE, self.toggle_pause):
+            logger.warning("Could not register pause hotkey; pause disabled.")
+            self._hotkey_thread_id = None
 
     def toggle_pause(self) -> None:
         """
@@ -118,15 +198,125 @@ class MacroPlayer:
             if self.status:
                 self.status("Playing")
 
-    def load_event(self, actions: List[Dict[str, Any]]) -> None:
+    def coalesce_moves(self, actions: List[Dict[str, Any]],
+                       window: float) -> List[Dict[str, Any]]:
+        """
+        Drop interior mouse-move events from dense trajectories.
+
+        A move is dropped when the moves immediately before and after it
+        fall within the given window, so only the endpoints of a fast
+        sweep are kept. Dense recordings (drags, rapid motion) can shrink
+        severalfold without visibly changing the replayed path.
+
+        Args:
+            actions: List of recorded events.
+            window: Bracketing window in seconds; <= 0 disables coalescing.
+
+        Returns:
+            List of events with redundant moves removed.
+        """
+        if window <= 0 or len(actions) < 3:
+            return actions
+
+        kept = [actions[0]]
+        for i in range(1, len(actions) - 1):
+            action = actions[i]
+            if (action["type"] == "mouseMove"
+                    and actions[i - 1]["type"] == "mouseMove"
+                    and actions[i + 1]["type"] == "mouseMove"):
+                prev_time = actions[i - 1].get("elapsed_time")
+                next_time = actions[i + 1].get("elapsed_time")
+                if (prev_time is not None and next_time is not None
+                        and next_time - prev_time < window):
+                    continue
+            kept.append(action)
+        kept.append(actions[-1])
+
+        dropped = len(actions) - len(kept)
+        if dropped:
+            logger.debug("Coalesced %d redundant mouse moves", dropped)
+        return kept
+
+    def compile_actions(self, actions: List[Dict[str, Any]],
+                        compression_window: float = MOVE_COALESCE_WINDOW
+                        ) -> None:
         """
-        Enqueue actions into the playback queue.
+        Precompile recorded actions for the playback loop.
+
+        Resolves each action's opcode, computes its absolute playback offset,
+        and pre-warms the scan-code cache in a single pass, so the
+        timing-critical loop does no dict dispatch or key translation per
+        event. Unknown action types are dropped here with a warning instead
+        of being checked every iteration.
 
         Args:
             actions: List of recorded events.
+            compression_window: Window in seconds for mouse-move
+                coalescing; <= 0 keeps every recorded move.
         """
+        actions = self.coalesce_moves(actions, compression_window)
+
+        offsets: list = []
+        ops: list = []
+        payloads: list = []
+        offset = 0.0
         for action in actions:
-            self.action_queue.put(action)
+            atype = action["type"]
+            op = OPCODE_MAP.get(atype)
+            if op is None:
+                logger.warning("No handler for action type: %s", atype)
+                continue
+
+            # Struct-of-arrays payloads: dict and key-map lookups happen
+            # here, once, so the hot loop touches only small tuples.
+            if op == OP_KEY:
+                payload = (action["button"], atype == "keyDown")
+                if self.use_sendinput:
+                    self.key_input(*payload)
+            elif op == OP_MOUSE:
+                button = mouse_button_map.get(
+                    action.get("button", "Button.left"), "left")
+                payload = (button, atype == "mouseDown", action.get("pos"))
+            elif op == OP_MOVE:
+                payload = action.get("pos")
+            else:
+                scroll = action.get("scroll_direction") or {}
+                payload = (action.get("pos"),
+                           scroll.get("dx", 0), scroll.get("dy", 0))
+
+            # Prefer the recorded absolute offset: summing clamped deltas
+            # accumulates drift over thousands of events.
+            elapsed_time = action.get("elapsed_time")
+            if elapsed_time is None:
+                offset += max(action.get("time_delta", 0),
+                              self.MIN_DELAY_THRESHOLD)
+                elapsed_time = offset
+            else:
+                offset = elapsed_time
+
+            offsets.append(elapsed_time)
+            ops.append(op)
+            payloads.append(payload)
+
+        self._offsets = offsets
+        self._ops = ops
+        self._payloads = payloads
+
+    def idle_wait(self, seconds: float) -> None:
+        """
+        Sleep for the coarse portion of an inter-event gap.
+
+        Uses a Win32 high-resolution waitable timer when available, which
+        honors sub-millisecond due times instead of rounding up to the OS
+        timer period like time.sleep.
+
+        Args:
+            seconds: Duration to wait.
+        """
+        if self._timer_handle:
+            win_input.timer_sleep(self._timer_handle, seconds)
+        else:
+            time.sleep(seconds)
 
     def playback_loop(self) -> None:
         """
@@ -136,39 +326,77 @@ class MacroPlayer:
         ensure accurate timing relative to the recorded macro's start. Handles 
         interruptions and ensures input states are cleaned up after playback ends.
         """
-        start_time = time.perf_counter()
+        # Bind hot attributes as locals: LOAD_FAST in the loop instead of
+        # an attribute lookup per reference per event.
+        perf_counter = time.perf_counter
+        idle_wait = self.idle_wait
+        pause_is_set = self.pause_event.is_set
+        pause_wait = self.pause_event.wait
+        handle_key = self.handle_key
+        handle_mouse = self.handle_mouse
+        handle_mouse_move = self.handle_mouse_move
+        handle_scroll = self.handle_scroll
+        debug = self._debug
+
+        start_time = perf_counter()
         elapsed = 0.0
 
-        while not self.action_queue.empty():
-            action = self.action_queue.get()
-            self.pause_event.wait()
-
-            time_delta = max(action.get("time_delta", 0),
-                             self.MIN_DELAY_THRESHOLD)
-
-            elapsed += time_delta
-            target_time = start_time + elapsed + self.total_paused_duration
+        # Deadline base = start + accumulated pause time. It only changes
+        # on resume, so it is rebased there instead of re-deriving
+        # start + offset + total_paused_duration for every event.
+        base_time = start_time
+        last_paused = 0.0
 
-            while True:
-                now = time.perf_counter()
-                remaining = target_time - now
-                if remaining <= 0:
+        if self.use_sendinput:
+            win_input.begin_timer_period()
+        try:
+            for offset, op, payload in zip(self._offsets, self._ops,
+                                           self._payloads):
+                # Fast path: is_set() is a plain flag read, so the common
+                # unpaused case skips the lock acquisition inside Event.wait().
+                # A spurious miss just defers the pause by one event.
+                if not pause_is_set():
+                    pause_wait()
+
+                if self.total_paused_duration != last_paused:
+                    last_paused = self.total_paused_duration
+                    base_time = start_time + last_paused
+
+                elapsed = offset
+                target_time = base_time + offset
+
+                # Hybrid wait: sleep until ~1ms before the target, then spin the
+                # final stretch for sub-millisecond accuracy without burning a
+                # core through long gaps.
+                remaining = target_time - perf_counter()
+                if remaining > 0.002:
+                    idle_wait(remaining - 0.001)
+                while perf_counter() < target_time:
+                    pass
+
+                if debug:
+                    error = perf_counter() - target_time
+                    logger.debug("Timing delta: %+0.6f s (%+.3f ms)",
+                                 error, error * 1000)
+
+                try:
+                    if op == OP_KEY:
+                        handle_key(*payload)
+                    elif op == OP_MOUSE:
+                        handle_mouse(*payload)
+                    elif op == OP_MOVE:
+                        handle_mouse_move(payload)
+                    else:
+                        handle_scroll(*payload)
+                except pyautogui.FailSafeException:
+                    logger.warning(
+                        "PyAutoGUI fail-safe triggered. Stopping playback.")
                     break
-                time.sleep(min(remaining, 0.001))
-
-            actual_time = time.perf_counter()
-            error = actual_time - target_time
-            logger.debug("Timing delta: %+0.6f s (%+.3f ms)",
-                         error, error * 1000)
-
-            try:
-                self.execute_action(action)
-            except pyautogui.FailSafeException:
-                logger.warning(
-                    "PyAutoGUI fail-safe triggered. Stopping playback.")
-                break
-            except (OSError, RuntimeError, ValueError, TypeError):
-                logger.exception("Error during %s", action['type'])
+                except (OSError, RuntimeError, ValueError, TypeError):
+                    logger.exception("Error during %s", OP_NAMES[op])
+        finally:
+            if self.use_sendinput:
+                win_input.end_timer_period()
 
         self.cleanup()
 
@@ -180,80 +408,280 @@ class MacroPlayer:
         logger.info("Drift: {%.3f}s", total_duration -
                     elapsed - self.total_paused_duration)
 
-    def execute_action(self, action: Dict[str, Any]) -> None:
+    def check_failsafe(self) -> None:
+        """
+        Raise pyautogui.FailSafeException if the cursor sits at (0, 0).
+
+        The SendInput path bypasses pyautogui, so its documented fail-safe
+        corner is re-checked here before dispatching synthesized input.
+        """
+        if win_input.cursor_pos() == (0, 0):
+            raise pyautogui.FailSafeException(
+                "Fail-safe triggered from mouse position at (0, 0).")
+
+    def resolve_scan(self, key_str: str) -> Optional[tuple]:
+        """
+        Resolve a recorded key string to a (vk, scan code, base flags) tuple.
+
+        Results (including failures) are cached so each distinct key is
+        translated through the Win32 mapping calls only once per playback.
+
+        Args:
+            key_str: Key string as recorded (e.g. "a", "Key.shift").
+
+        Returns:
+            tuple | None: (vk, scan, flags) for KEYBDINPUT, or None if unmapped.
+        """
+        if key_str in self._scan_cache:
+            return self._scan_cache[key_str]
+
+        resolved = None
+        vk = win_input.vk_for_key(key_str)
+        if vk is not None:
+            scan = win_input.MapVirtualKeyW(vk, win_input.MAPVK_VK_TO_VSC)
+            flags = win_input.KEYEVENTF_SCANCODE
+            if key_str in win_input.extended_keys:
+                flags |= win_input.KEYEVENTF_EXTENDEDKEY
+            resolved = (vk, scan, flags)
+
+        self._scan_cache[key_str] = resolved
+        return resolved
+
+    def key_input(self, key_str: str, down: bool) -> Optional[Any]:
+        """
+        Return a prefilled one-element INPUT array for a key event.
+
+        Templates are immutable once built, so each distinct (key, down)
+        pair is marshalled through the ctypes field descriptors exactly
+        once and reused for every later occurrence.
+
+        Args:
+            key_str: Key string as recorded.
+            down: True for key down, False for key up.
+
+        Returns:
+            ctypes array | None: Cached INPUT array, or None if unmapped.
+        """
+        entry = ("key", key_str, down)
+        inputs = self._input_cache.get(entry)
+        if inputs is None and entry not in self._input_cache:
+            resolved = self.resolve_scan(key_str)
+            if resolved is None:
+                self._input_cache[entry] = None
+                return None
+            _, scan, flags = resolved
+            if not down:
+                flags |= win_input.KEYEVENTF_KEYUP
+            inputs = (win_input.INPUT * 1)()
+            inputs[0].type = win_input.INPUT_KEYBOARD
+            inputs[0].ki.wScan = scan
+            inputs[0].ki.dwFlags = flags
+            self._input_cache[entry] = inputs
+        return inputs
+
+    def scroll_input(self, flags: int, amount: int) -> Any:
+        """
+        Return a prefilled one-element INPUT array for a scroll event.
+
+        Args:
+            flags: MOUSEEVENTF_WHEEL or MOUSEEVENTF_HWHEEL.
+            amount: Signed wheel delta.
+
+        Returns:
+            ctypes array: Cached INPUT array.
+        """
+        entry = ("scroll", flags, amount)
+        inputs = self._input_cache.get(entry)
+        if inputs is None:
+            inputs = (win_input.INPUT * 1)()
+            inputs[0].type = win_input.INPUT_MOUSE
+            inputs[0].mi.mouseData = amount & 0xFFFFFFFF
+            inputs[0].mi.dwFlags = flags
+            self._input_cache[entry] = inputs
+        return inputs
+
+    def send_key(self, key_str: str, down: bool) -> None:
+        """
+        Dispatch a single key press or release.
+
+        Uses one batched SendInput call on Windows; falls back to
+        pyautogui elsewhere or for keys without a scan-code mapping.
+
+        Args:
+            key_str: Key string as recorded.
+            down: True for key down, False for key up.
         """
-        Matches event to its appropriate handler.
+        if self.use_sendinput:
+            inputs = self.key_input(key_str, down)
+            if inputs is not None:
+                self.check_failsafe()
+                win_input.SendInput(1, inputs, win_input.INPUT_SIZE)
+                return
+
+        key = key_map.get(key_str, key_str)
+        if down:
+            pyautogui.keyDown(key)
+        else:
+            pyautogui.keyUp(key)
+
+    def send_button(self, button: str, down: bool, pos: tuple) -> None:
+        """
+        Move the cursor and dispatch a mouse button press or release.
 
         Args:
-            action: The event dictionary containing the event's recorded 
-            details (type, button, pos, etc.).
+            button: pyautogui button name ("left", "right", "middle").
+            down: True for button down, False for button up.
+            pos: (x, y) screen coordinates of the event.
         """
-        handler = self.handlers.get(action["type"])
-        if handler:
-            handler(action)
+        if self.use_sendinput:
+            self.check_failsafe()
+            down_flag, up_flag = win_input.mouse_flag_map[button]
+            chord = self._chord_buffer
+            chord[0].mi.dx = int(pos[0]) * 65535 // self._screen_w
+            chord[0].mi.dy = int(pos[1]) * 65535 // self._screen_h
+            chord[1].mi.dwFlags = down_flag if down else up_flag
+            win_input.SendInput(2, chord, win_input.INPUT_SIZE)
+            return
+
+        pyautogui.moveTo(*pos, duration=0)
+        if down:
+            pyautogui.mouseDown(button=button)
         else:
-            logger.warning("No handler for action type: %s['type']", action)
+            pyautogui.mouseUp(button=button)
+
+    def send_move(self, pos: tuple) -> None:
+        """
+        Move the cursor to an absolute position.
+
+        Args:
+            pos: (x, y) screen coordinates.
+        """
+        if self.use_sendinput:
+            self.check_failsafe()
+            move = self._move_buffer
+            move[0].mi.dx = int(pos[0]) * 65535 // self._screen_w
+            move[0].mi.dy = int(pos[1]) * 65535 // self._screen_h
+            win_input.SendInput(1, move, win_input.INPUT_SIZE)
+            return
+        pyautogui.moveTo(*pos, duration=0)
+
+    def send_scroll(self, dx: int, dy: int) -> None:
+        """
+        Dispatch scroll wheel movement.
+
+        Args:
+            dx: Horizontal scroll ticks.
+            dy: Vertical scroll ticks.
+        """
+        if self.use_sendinput:
+            self.check_failsafe()
+            if dy:
+                inputs = self.scroll_input(
+                    win_input.MOUSEEVENTF_WHEEL,
+                    int(dy * self.SCROLL_MULTIPLIER))
+                win_input.SendInput(1, inputs, win_input.INPUT_SIZE)
+            if dx:
+                inputs = self.scroll_input(
+                    win_input.MOUSEEVENTF_HWHEEL,
+                    int(dx * self.SCROLL_MULTIPLIER))
+                win_input.SendInput(1, inputs, win_input.INPUT_SIZE)
+            return
+
+        if dy:
+            pyautogui.scroll(int(dy * self.SCROLL_MULTIPLIER))
+        if dx:
+            pyautogui.hscroll(int(dx * self.SCROLL_MULTIPLIER))
 
-    def handle_key(self, action: Dict[str, Any]) -> None:
+    def handle_key(self, key: str, down: bool) -> None:
         """
         Handle keyDown and keyUp events.
 
         Args:
-            action: The dictionary containing the event's recorded details.
+            key: Key string as recorded.
+            down: True for key down, False for key up.
         """
-        key = key_map.get(action["button"], action["button"])
-        if action["type"] == "keyDown" and key not in self.pressed_keys:
-            pyautogui.keyDown(key)
+        if self.use_sendinput:
+            resolved = self.resolve_scan(key)
+            if resolved:
+                vk = resolved[0]
+                index = vk >> 3
+                mask = 1 << (vk & 7)
+                held = self._pressed_bitmap[index] & mask
+                if down and not held:
+                    self.send_key(key, down=True)
+                    self._pressed_bitmap[index] |= mask
+                    if self._debug:
+                        logger.debug("Key down: {%s}", key)
+                elif not down and held:
+                    self.send_key(key, down=False)
+                    self._pressed_bitmap[index] &= ~mask
+                    if self._debug:
+                        logger.debug("Key up: {%s}", key)
+                return
+
+        if down and key not in self.pressed_keys:
+            self.send_key(key, down=True)
             self.pressed_keys.add(key)
-            logger.debug("Key down: {%s}", key)
-        elif action["type"] == "keyUp" and key in self.pressed_keys:
-            pyautogui.keyUp(key)
+            if self._debug:
+                logger.debug("Key down: {%s}", key)
+        elif not down and key in self.pressed_keys:
+            self.send_key(key, down=False)
             self.pressed_keys.remove(key)
-            logger.debug("Key up: {%s}", key)
+            if self._debug:
+                logger.debug("Key up: {%s}", key)
 
-    def handle_mouse(self, action: Dict[str, Any]) -> None:
+    def handle_mouse(self, button: str, down: bool,
+                     pos: Optional[tuple]) -> None:
         """
         Handle mouseDown and mouseUp events.
 
         Args:
-            action: The dictionary containing the event's recorded details.
+            button: pyautogui button name ("left", "right", "middle").
+            down: True for button down, False for button up.
+            pos: (x, y) screen coordinates, or None for the current position.
         """
-        button = mouse_button_map.get(
-            action.get("button", "Button.left"), "left")
-        pos = action.get("pos", pyautogui.position())
-        pyautogui.moveTo(*pos, duration=0)
-
-        if action["type"] == "mouseDown" and button not in self.pressed_mouse_buttons:
-            pyautogui.mouseDown(button=button)
+        if pos is None:
+            if self.use_sendinput:
+                pos = win_input.cursor_pos()
+            else:
+                pos = pyautogui.position()
+
+        if down and button not in self.pressed_mouse_buttons:
+            self.send_button(button, True, pos)
             self.pressed_mouse_buttons[button] = pos
-            logger.debug("Mouse down: {%s} at {%s}", button, pos)
-        elif action["type"] == "mouseUp" and button in self.pressed_mouse_buttons:
-            pyautogui.mouseUp(button=button)
+            if self._debug:
+                logger.debug("Mouse down: {%s} at {%s}", button, pos)
+        elif not down and button in self.pressed_mouse_buttons:
+            self.send_button(button, False, pos)
             self.pressed_mouse_buttons.pop(button)
-            logger.debug("Mouse up: {%s} at {%s}", button, pos)
+            if self._debug:
+                logger.debug("Mouse up: {%s} at {%s}", button, pos)
 
-    def handle_mouse_move(self, action: Dict[str, Any]) -> None:
+    def handle_mouse_move(self, pos: Optional[tuple]) -> None:
         """
         Handle mouseMove events.
 
-        Suppresses redundant movement calls if the cursor is within a 2-pixel 
+        Suppresses redundant movement calls if the cursor is within a 2-pixel
         threshold of the target to optimize system overhead.
 
         Args:
-            action: The dictionary containing the event's recorded details.
+            pos: (x, y) screen coordinates.
         """
-        pos = action.get("pos")
         if not pos:
             return
 
-        current_pos = pyautogui.position()
+        if self.use_sendinput:
+            current_pos = win_input.cursor_pos()
+        else:
+            current_pos = pyautogui.position()
         if abs(current_pos[0] - pos[0]) < 2 and abs(current_pos[1] - pos[1]) < 2:
             return
 
-        pyautogui.moveTo(*pos, duration=0)
-        logger.debug("Mouse move: %s", pos)
+        self.send_move(pos)
+        if self._debug:
+            logger.debug("Mouse move: %s", pos)
 
-    def handle_scroll(self, action: Dict[str, Any]) -> None:
+    def handle_scroll(self, pos: Optional[tuple], dx: int, dy: int) -> None:
         """
         Handle scroll events.
 
@@ -261,20 +689,50 @@ class MacroPlayer:
         user's scroll speed.
 
         Args:
-            action: The dictionary containing the event's recorded details.
+            pos: (x, y) screen coordinates, or None to scroll in place.
+            dx: Horizontal scroll ticks.
+            dy: Vertical scroll ticks.
         """
-        if action.get("pos"):
-            pyautogui.moveTo(action["pos"][0], action["pos"][1], duration=0)
+        if pos:
+            self.send_move(pos)
 
-        dx = action.get("scroll_direction", {}).get("dx", 0)
-        dy = action.get("scroll_direction", {}).get("dy", 0)
+        self.send_scroll(dx, dy)
+        if self._debug:
+            logger.debug("Scroll: dx=%s, dy=%s", dx, dy)
 
-        if dy:
-            pyautogui.scroll(int(dy * self.SCROLL_MULTIPLIER))
-        if dx:
-            pyautogui.hscroll(int(dx * self.SCROLL_MULTIPLIER))
+    def release_pressed_keys(self) -> None:
+        """
+        Release every tracked key.
 
-        logger.debug("Scroll: dx=%s, dy=%s", dx, dy)
+        On the SendInput path the key-up events are packed into one INPUT
+        array and dispatched in a single call, instead of one Win32
+        notification per held key. Keys that were pressed through the
+        pyautogui fallback are released individually.
+        """
+        if self.use_sendinput:
+            # Sweep the bitmap, skipping zero bytes, and release every set
+            # bit by virtual-key code in one batched call.
+            held_vks = [
+                (index << 3) | bit
+                for index, byte in enumerate(self._pressed_bitmap) if byte
+                for bit in range(8) if byte & (1 << bit)
+            ]
+            if held_vks:
+                inputs = (win_input.INPUT * len(held_vks))()
+                for inp, vk in zip(inputs, held_vks):
+                    inp.type = win_input.INPUT_KEYBOARD
+                    inp.ki.wVk = vk
+                    inp.ki.dwFlags = win_input.KEYEVENTF_KEYUP
+                win_input.SendInput(
+                    len(held_vks), inputs, win_input.INPUT_SIZE)
+            self._pressed_bitmap[:] = bytes(32)
+
+        # Keys pressed through the pyautogui fallback are released one by one.
+        for key in list(self.pressed_keys):
+            try:
+                self.send_key(key, down=False)
+            except (pyautogui.FailSafeException, OSError, RuntimeError):
+                pass
 
     def cleanup(self) -> None:
         """
@@ -283,21 +741,26 @@ class MacroPlayer:
         Ensures that no keyDown/mouse button presses remain active without 
         a corresponding keyUp/mouse button release when playback ends or is stopped.
         """
-        for key in list(self.pressed_keys):
-            try:
-                pyautogui.keyUp(key)
-            except (pyautogui.FailSafeException, OSError, RuntimeError):
-                pass
+        self.release_pressed_keys()
         self.pressed_keys.clear()
 
-        for button in list(self.pressed_mouse_buttons.keys()):
+        for button, pos in list(self.pressed_mouse_buttons.items()):
             try:
-                pyautogui.mouseUp(button=button)
+                self.send_button(button, False, pos)
             except (pyautogui.FailSafeException, OSError, RuntimeError):
                 pass
         self.pressed_mouse_buttons.clear()
 
-        try:
-            keyboard.remove_hotkey(self.PAUSE_KEY)
-        except KeyError:
-            pass
+        if self.use_sendinput:
+            if self._hotkey_thread_id is not None:
+                win_input.stop_pump(self._hotkey_thread_id)
+                self._hotkey_thread_id = None
+        else:
+            try:
+                keyboard.remove_hotkey(self.PAUSE_KEY)
+            except KeyError:
+                pass
+
+        if self._timer_handle:
+            win_input.close_timer(self._timer_handle)
+            self._timer_handle = None
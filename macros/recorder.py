@@ -5,6 +5,7 @@ for later playback.
 
 Classes:
     EventType: Constants for supported input event types.
+    Event: Compact record for a single captured input event.
     MouseState: Keeps track of the mouse's current position and timestamps.
     KeyboardState: Keeps track of all current keys being pressed. 
     MacroRecorder: Engine for capturing, buffering, and processing inputs during
@@ -12,16 +13,39 @@ Classes:
 """
 
 import logging
+import os
+import queue
 import threading
 from collections import deque
+from dataclasses import dataclass
 from enum import Enum
-from time import perf_counter, sleep
+from pathlib import Path
+from time import perf_counter, perf_counter_ns
 from typing import Any, Callable, Dict, Optional
 
 from pynput import keyboard, mouse
 
+from utils.json_utils import append_jsonl
+
 logger = logging.getLogger("recorder")
 
+# Module-level bindings of the control keys; callbacks compare against
+# these with a LOAD_GLOBAL instead of an attribute lookup through self.
+_PAUSE_KEY = keyboard.Key.pause
+_EXIT_KEY = keyboard.Key.esc
+
+# Bit positions for the keys most often held in chords (modifiers and
+# letters). Membership for these is a single int AND instead of a set
+# lookup; everything else falls back to the pressed_keys set.
+_COMMON_KEYS = (
+    "Key.shift", "Key.shift_l", "Key.shift_r",
+    "Key.ctrl", "Key.ctrl_l", "Key.ctrl_r",
+    "Key.alt", "Key.alt_l", "Key.alt_r",
+    "Key.cmd", "Key.cmd_l", "Key.cmd_r",
+    "Key.space",
+) + tuple("abcdefghijklmnopqrstuvwxyz")
+_KEY_BITS = {key: 1 << i for i, key in enumerate(_COMMON_KEYS)}
+
 
 class EventType(Enum):
     """Constants representing the different types of input events."""
@@ -34,13 +58,42 @@ class EventType(Enum):
     SCROLL = "scroll"
 
 
+@dataclass(slots=True)
+class Event:
+    """
+    A single recorded input event.
+
+    Slots keep each record a fraction of the size of the dict it replaces,
+    which matters for long recordings with tens of thousands of events.
+    """
+
+    elapsed_time: float
+    time_delta: float
+    type: str
+    button: str
+    pos: Optional[tuple] = None
+    scroll_direction: Optional[dict] = None
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Returns the event as a plain dict for JSON serialization."""
+        return {
+            "elapsed_time": self.elapsed_time,
+            "time_delta": self.time_delta,
+            "type": self.type,
+            "button": self.button,
+            "pos": self.pos,
+            "scroll_direction": self.scroll_direction,
+        }
+
+
 class MouseState:
     """Tracks mouse position and timing for move events."""
 
     def __init__(self):
         self.position = None
-        self.curr_timestamp = 0.0
-        self.last_timestamp = 0.0
+        # Integer nanosecond timestamps from perf_counter_ns.
+        self.curr_timestamp = 0
+        self.last_timestamp = 0
 
 
 class KeyboardState:
@@ -64,17 +117,27 @@ class MacroRecorder:
     Recording continues until the EXIT_KEY is pressed.
     """
 
-    # Use pynput key codes
-    PAUSE_KEY = keyboard.Key.pause
-    EXIT_KEY = keyboard.Key.esc
-    IGNORED_KEYS = []
-    # Polling rates for mouse movement recording, measured in seconds.
+    # Use pynput key codes. Public aliases of the module-level constants
+    # the hot callbacks compare against.
+    PAUSE_KEY = _PAUSE_KEY
+    EXIT_KEY = _EXIT_KEY
+    # frozenset gives O(1) membership checks in the listener callbacks.
+    IGNORED_KEYS = frozenset()
+    # Polling rates for mouse movement recording, measured in integer
+    # nanoseconds to match the perf_counter_ns timestamps used internally.
     # Default minimum interval between recorded moves (50 events/second).
-    BASE_MOUSE_MOVE_POLL = 0.02
+    BASE_MOUSE_MOVE_POLL = 20_000_000
     # Fast interval used during rapid motion (100 events/second).
-    HIGH_MOUSE_MOVE_POLL = 0.01
+    HIGH_MOUSE_MOVE_POLL = 10_000_000
     # Time delta threshold: if movement is faster than this, HIGH_MOUSE_MOVE_POLL is used.
-    RATE_THRESHOLD = 0.03
+    RATE_THRESHOLD = 30_000_000
+    # Scroll ticks landing within this window (seconds) at the same cursor
+    # position are merged into one event.
+    SCROLL_COALESCE_WINDOW = 0.016
+    # Autosave flushes to disk after this many events or this many seconds,
+    # whichever comes first, so a crash loses at most one batch.
+    AUTOSAVE_FLUSH_EVENTS = 256
+    AUTOSAVE_FLUSH_INTERVAL = 1.0
 
     def __init__(self, status: Optional[Callable[[str], None]]) -> None:
         """
@@ -92,17 +155,35 @@ class MacroRecorder:
 
         self.mouse = MouseState()
         self.keyboard = KeyboardState()
-        self.events = []
+        # deque appends in fixed-size blocks, so long recordings never hit
+        # the occasional O(n) reallocation of list.append.
+        self.events = deque()
+
+        # Memoizes normalize_key results; the same Key objects arrive on
+        # every repeat and release, so stringify each one only once.
+        self._key_str_cache = {}
+        # Bitmask mirror of pressed_keys for the keys in _KEY_BITS.
+        self._pressed_bits = 0
 
         self.exit = threading.Event()
-        self.lock = threading.Lock()
-        self.event_queue = deque()
+        # SimpleQueue.put is O(1) and never blocks, so listener callbacks
+        # hand events off without contending with the processor thread.
+        self.event_queue = queue.SimpleQueue()
+        # Bound once so callbacks skip the two attribute hops per event.
+        self._enqueue = self.event_queue.put
 
         self.processor_thread = None
         self.mouse_listener = None
         self.keyboard_listener = None
 
+        # Crash-safety autosave; opened at the start of each session.
+        self.autosave_path = None
+        self._autosave_file = None
+
         self.status = status
+        # Checked once so the per-event debug call is a plain bool test
+        # when debug logging is off.
+        self._debug = logger.isEnabledFor(logging.DEBUG)
 
     def start_recording(self) -> None:
         """
@@ -114,6 +195,15 @@ class MacroRecorder:
         session_start_time = perf_counter()
         logger.info("Recording started")
 
+        try:
+            recordings_dir = Path.cwd() / "recordings"
+            recordings_dir.mkdir(parents=True, exist_ok=True)
+            self.autosave_path = recordings_dir / "autosave.jsonl"
+            self._autosave_file = self.autosave_path.open("wb")
+        except OSError:
+            logger.exception("Could not open autosave file; continuing without it")
+            self._autosave_file = None
+
         self.processor_thread = threading.Thread(
             target=self.process_events,
             daemon=True
@@ -150,11 +240,11 @@ class MacroRecorder:
         """
         if not self.is_paused:
             self.is_paused = True
-            self.pause_start_time = perf_counter()
+            self.pause_start_time = perf_counter_ns()
             if self.status:
                 self.status("Paused")
         else:
-            paused_duration = perf_counter() - self.pause_start_time
+            paused_duration = perf_counter_ns() - self.pause_start_time
             if self.recording_start_time is not None:
                 self.recording_start_time += paused_duration
 
@@ -173,9 +263,14 @@ class MacroRecorder:
         Returns:
             str: A normalized string representation of the key
         """
-        if isinstance(key, keyboard.KeyCode):
-            return key.char.lower() if key.char else str(key)
-        return str(key)
+        key_str = self._key_str_cache.get(key)
+        if key_str is None:
+            # Only KeyCode has a char attribute; getattr avoids the
+            # isinstance check for special keys.
+            char = getattr(key, "char", None)
+            key_str = char.lower() if char else str(key)
+            self._key_str_cache[key] = key_str
+        return key_str
 
     def on_press(self, key: keyboard.Key | keyboard.KeyCode) -> None:
         """
@@ -188,29 +283,27 @@ class MacroRecorder:
         Args:
             key (pynput.keyboard.Key | pynput.keyboard.KeyCode): The key pressed.
         """
-        if key == self.PAUSE_KEY:
+        if key == _PAUSE_KEY:
             self.toggle_pause()
             return
 
+        # Bail before normalizing so paused/ignored events cost nothing.
+        if self.is_paused or key in self.IGNORED_KEYS:
+            return
+
         key_str = self.normalize_key(key)
 
-        if (
-            key in self.IGNORED_KEYS
-            or key_str in self.keyboard.pressed_keys
-            or self.is_paused
-        ):
+        bit = _KEY_BITS.get(key_str, 0)
+        if bit:
+            if self._pressed_bits & bit:
+                return
+            self._pressed_bits |= bit
+        elif key_str in self.keyboard.pressed_keys:
             return
 
         self.keyboard.pressed_keys.add(key_str)
 
-        event = {
-            "timestamp": perf_counter(),
-            "event_type": EventType.KEY_DOWN,
-            "button": key_str,
-        }
-
-        with self.lock:
-            self.event_queue.append(event)
+        self._enqueue((perf_counter_ns(), EventType.KEY_DOWN, key_str))
 
     def on_release(self, key: keyboard.Key | keyboard.KeyCode) -> None:
         """
@@ -221,27 +314,20 @@ class MacroRecorder:
         Args:
             key (pynput.keyboard.Key | pynput.keyboard.KeyCode): The key released.
         """
-        key_str = self.normalize_key(key)
-
         if (
-            key in self.IGNORED_KEYS
-            or self.is_paused
-            or key == self.PAUSE_KEY
+            self.is_paused
+            or key == _PAUSE_KEY
+            or key in self.IGNORED_KEYS
         ):
             return
 
+        key_str = self.normalize_key(key)
+        self._pressed_bits &= ~_KEY_BITS.get(key_str, 0)
         self.keyboard.pressed_keys.discard(key_str)
 
-        event = {
-            "timestamp": perf_counter(),
-            "event_type": EventType.KEY_UP,
-            "button": key_str,
-        }
-
-        with self.lock:
-            self.event_queue.append(event)
+        self._enqueue((perf_counter_ns(), EventType.KEY_UP, key_str))
 
-        if key == self.EXIT_KEY:
+        if key == _EXIT_KEY:
             self.exit.set()
 
     def on_click(self, x: int, y: int, button: mouse.Button, pressed: bool) -> None:
@@ -259,15 +345,7 @@ class MacroRecorder:
 
         ev_type = EventType.MOUSE_DOWN if pressed else EventType.MOUSE_UP
 
-        event = {
-            "timestamp": perf_counter(),
-            "event_type": ev_type,
-            "button": str(button),
-            "pos": (x, y),
-        }
-
-        with self.lock:
-            self.event_queue.append(event)
+        self._enqueue((perf_counter_ns(), ev_type, str(button), (x, y)))
 
     def on_scroll(self, x: int, y: int, dx: int, dy: int) -> None:
         """
@@ -282,16 +360,13 @@ class MacroRecorder:
         if self.is_paused:
             return
 
-        event = {
-            "timestamp": perf_counter(),
-            "event_type": EventType.SCROLL,
-            "button": "mouse_wheel",
-            "pos": (x, y),
-            "scroll_direction": {"dx": dx, "dy": dy},
-        }
-
-        with self.lock:
-            self.event_queue.append(event)
+        self._enqueue((
+            perf_counter_ns(),
+            EventType.SCROLL,
+            "mouse_wheel",
+            (x, y),
+            {"dx": dx, "dy": dy},
+        ))
 
     def on_move(self, x: int, y: int) -> None:
         """
@@ -303,7 +378,7 @@ class MacroRecorder:
             x (int): Current mouse X-coordinate.
             y (int): Current mouse Y-coordinate.
         """
-        now = perf_counter()
+        now = perf_counter_ns()
         self.mouse.position = (x, y)
         self.mouse.curr_timestamp = now
 
@@ -314,79 +389,144 @@ class MacroRecorder:
         else:
             poll = self.BASE_MOUSE_MOVE_POLL
 
-        if now - self.mouse.last_timestamp >= poll and not self.is_paused:
-            event = {
-                "timestamp": now,
-                "event_type": EventType.MOUSE_MOVE,
-                "button": "mouse_move",
-                "pos": self.mouse.position,
-            }
-            with self.lock:
-                self.event_queue.append(event)
+        if not self.is_paused and now - self.mouse.last_timestamp >= poll:
+            self._enqueue(
+                (now, EventType.MOUSE_MOVE, "mouse_move", self.mouse.position)
+            )
             self.mouse.last_timestamp = now
 
     def process_events(self) -> None:
         """
         Background thread that processes events from the queue.
 
-        Runs separately from the input listeners and handles events safely in batches.
-        """
-        while not self.exit.is_set() or self.event_queue:
-            batch = []
-
-            with self.lock:
-                while self.event_queue:
-                    batch.append(self.event_queue.popleft())
-
-            for raw_event in batch:
-                try:
-                    self.record_event(raw_event)
-                except (KeyError, TypeError) as e:
-                    logger.error("Error processing event: %s", e)
+        Runs separately from the input listeners and blocks on the queue
+        until the recording session ends and the queue has drained.
 
-            sleep(0.002)
+        Also owns the autosave file: recorded events are appended to it as
+        JSON lines in batches, so a crash loses at most one flush window.
+        """
+        pending = []
+        last_flush = perf_counter()
+
+        while not self.exit.is_set() or not self.event_queue.empty():
+            try:
+                raw_event = self.event_queue.get(timeout=0.1)
+            except queue.Empty:
+                continue
+
+            try:
+                recorded = self.record_event(*raw_event)
+            except (TypeError, AttributeError) as e:
+                logger.error("Error processing event: %s", e)
+                continue
+
+            if recorded is None or self._autosave_file is None:
+                continue
+
+            pending.append(recorded)
+            now = perf_counter()
+            if (
+                len(pending) >= self.AUTOSAVE_FLUSH_EVENTS
+                or now - last_flush >= self.AUTOSAVE_FLUSH_INTERVAL
+            ):
+                self.flush_autosave(pending)
+                pending.clear()
+                last_flush = now
+
+        if self._autosave_file is not None:
+            if pending:
+                self.flush_autosave(pending)
+            try:
+                self._autosave_file.close()
+            except OSError:
+                logger.exception("Error closing autosave file")
+            self._autosave_file = None
+
+    def flush_autosave(self, events: list) -> None:
+        """
+        Appends a batch of events to the autosave file and syncs it to disk.
 
-    def record_event(self, event: Dict[str, Any]) -> None:
+        Args:
+            events (list[Event]): Events not yet written to the autosave file.
+        """
+        try:
+            append_jsonl(
+                self._autosave_file,
+                [event.to_dict() for event in events],
+            )
+            self._autosave_file.flush()
+            os.fsync(self._autosave_file.fileno())
+        except (OSError, TypeError):
+            logger.exception("Autosave flush failed")
+
+    def record_event(
+        self,
+        timestamp: int,
+        event_type: EventType,
+        button: str,
+        pos: Optional[tuple] = None,
+        scroll_direction: Optional[Dict[str, int]] = None,
+    ) -> Optional[Event]:
         """
         Saves the event recorded by listeners to the final events list.
 
         Calculates elapsed time and time delta between events.
 
         Args:
-            event (dict): Event captured by listeners, containing at least 
-                'timestamp' and 'event_type'.
-        """
-        timestamp = event["timestamp"]
-        event_type = event.get("event_type")
-        button = event.get("button")
-        pos = event.get("pos")
-        scroll_direction = event.get("scroll_direction")
+            timestamp (int): perf_counter_ns timestamp of the raw event.
+            event_type (EventType): The type of input event.
+            button (str): Normalized key or button name.
+            pos (tuple | None): Cursor position for mouse events.
+            scroll_direction (dict | None): dx/dy amounts for scroll events.
 
+        Returns:
+            The appended Event, or None if the event was coalesced into
+            the previous one.
+        """
         if self.recording_start_time is None:
             self.recording_start_time = timestamp
 
-        elapsed_time = timestamp - self.recording_start_time
-        prev_elapsed = self.events[-1]["elapsed_time"] if self.events else 0
+        # Timestamps are integer nanoseconds from perf_counter_ns; convert
+        # to float seconds only here so the saved format stays the same.
+        elapsed_time = (timestamp - self.recording_start_time) / 1e9
+
+        # A physical scroll detent fires a burst of tick events; fold ticks
+        # close together at the same position into the previous event.
+        if event_type is EventType.SCROLL and self.events:
+            last = self.events[-1]
+            if (
+                last.type == EventType.SCROLL.value
+                and last.pos == pos
+                and elapsed_time - last.elapsed_time <= self.SCROLL_COALESCE_WINDOW
+            ):
+                last.scroll_direction["dx"] += scroll_direction["dx"]
+                last.scroll_direction["dy"] += scroll_direction["dy"]
+                return None
+
+        prev_elapsed = self.events[-1].elapsed_time if self.events else 0
         delta = elapsed_time - prev_elapsed
 
-        event_struct = {
-            "elapsed_time": elapsed_time,
-            "time_delta": delta,
-            "type": event_type.value,
-            "button": str(button),
-            "pos": pos,
-            "scroll_direction": scroll_direction,
-        }
+        event_struct = Event(
+            elapsed_time=elapsed_time,
+            time_delta=delta,
+            type=event_type.value,
+            button=str(button),
+            pos=pos,
+            scroll_direction=scroll_direction,
+        )
 
         self.events.append(event_struct)
 
-        logger.debug(
-            "%-10s %-12s delta_t=%.4f s %s",
-            event_type.value,
-            button,
-            delta,
-            event_struct.get('pos', '')
-        )
+        if self._debug:
+            logger.debug(
+                "%-10s %-12s delta_t=%.4f s %s",
+                event_type.value,
+                button,
+                delta,
+                event_struct.pos or ''
+            )
+
+        return event_struct
 
     def cleanup(self) -> None:
         """
@@ -394,26 +534,20 @@ class MacroRecorder:
         pressed keys, and shuts down the mouse and keyboard listeners.
         """
         if self.mouse.position:
-            event = {
-                "timestamp": perf_counter(),
-                "event_type": EventType.MOUSE_MOVE,
-                "button": "mouse_move",
-                "pos": self.mouse.position,
-            }
-            with self.lock:
-                self.event_queue.append(event)
-
-        for key in list(self.keyboard.pressed_keys):
-            key_str = self.normalize_key(key)
-            event = {
-                "timestamp": perf_counter(),
-                "event_type": EventType.KEY_UP,
-                "button": key_str,
-            }
-            with self.lock:
-                self.event_queue.append(event)
+            self._enqueue((
+                perf_counter_ns(),
+                EventType.MOUSE_MOVE,
+                "mouse_move",
+                self.mouse.position,
+            ))
+
+        # pressed_keys already holds normalized strings from on_press.
+        for key_str in tuple(self.keyboard.pressed_keys):
+            self._enqueue((perf_counter_ns(), EventType.KEY_UP, key_str))
 
         self.keyboard.pressed_keys.clear()
+        self._pressed_bits = 0
+        self._key_str_cache.clear()
 
         try:
             if self.mouse_listener and self.mouse_listener.running:
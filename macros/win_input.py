@@ -0,0 +1,359 @@
+"""
+ctypes bindings for the Win32 SendInput API.
+
+Defines the INPUT/MOUSEINPUT/KEYBDINPUT structures, the event flags, and
+the virtual-key code table needed to synthesize input directly, avoiding
+pyautogui's per-call sleeps and marshalling overhead. Importable only on
+Windows; MacroPlayer falls back to pyautogui on other platforms.
+"""
+
+import ctypes
+from ctypes import wintypes
+
+user32 = ctypes.windll.user32
+kernel32 = ctypes.windll.kernel32
+winmm = ctypes.windll.winmm
+
+# INPUT.type discriminators
+INPUT_MOUSE = 0
+INPUT_KEYBOARD = 1
+
+# KEYBDINPUT.dwFlags
+KEYEVENTF_EXTENDEDKEY = 0x0001
+KEYEVENTF_KEYUP = 0x0002
+KEYEVENTF_SCANCODE = 0x0008
+
+# MOUSEINPUT.dwFlags
+MOUSEEVENTF_MOVE = 0x0001
+MOUSEEVENTF_LEFTDOWN = 0x0002
+MOUSEEVENTF_LEFTUP = 0x0004
+MOUSEEVENTF_RIGHTDOWN = 0x0008
+MOUSEEVENTF_RIGHTUP = 0x0010
+MOUSEEVENTF_MIDDLEDOWN = 0x0020
+MOUSEEVENTF_MIDDLEUP = 0x0040
+MOUSEEVENTF_WHEEL = 0x0800
+MOUSEEVENTF_HWHEEL = 0x1000
+MOUSEEVENTF_ABSOLUTE = 0x8000
+
+# MapVirtualKeyW translation type
+MAPVK_VK_TO_VSC = 0
+
+# GetSystemMetrics indices
+SM_CXSCREEN = 0
+SM_CYSCREEN = 1
+
+# Hotkey message pump
+VK_PAUSE = 0x13
+WM_HOTKEY = 0x0312
+WM_QUIT = 0x0012
+
+# Waitable timer creation (Windows 10 1803+ supports high resolution)
+CREATE_WAITABLE_TIMER_HIGH_RESOLUTION = 0x00000002
+TIMER_ALL_ACCESS = 0x1F0003
+INFINITE = 0xFFFFFFFF
+
+# ULONG_PTR is pointer-sized; wintypes does not define it.
+ULONG_PTR = ctypes.c_size_t
+
+
+class MOUSEINPUT(ctypes.Structure):
+    """Mouse portion of the INPUT union."""
+
+    _fields_ = [
+        ("dx", wintypes.LONG),
+        ("dy", wintypes.LONG),
+        ("mouseData", wintypes.DWORD),
+        ("dwFlags", wintypes.DWORD),
+        ("time", wintypes.DWORD),
+        ("dwExtraInfo", ULONG_PTR),
+    ]
+
+
+class KEYBDINPUT(ctypes.Structure):
+    """Keyboard portion of the INPUT union."""
+
+    _fields_ = [
+        ("wVk", wintypes.WORD),
+        ("wScan", wintypes.WORD),
+        ("dwFlags", wintypes.DWORD),
+        ("time", wintypes.DWORD),
+        ("dwExtraInfo", ULONG_PTR),
+    ]
+
+
+class HARDWAREINPUT(ctypes.Structure):
+    """Hardware portion of the INPUT union (unused, kept for layout)."""
+
+    _fields_ = [
+        ("uMsg", wintypes.DWORD),
+        ("wParamL", wintypes.WORD),
+        ("wParamH", wintypes.WORD),
+    ]
+
+
+class _INPUTUNION(ctypes.Union):
+    _fields_ = [
+        ("mi", MOUSEINPUT),
+        ("ki", KEYBDINPUT),
+        ("hi", HARDWAREINPUT),
+    ]
+
+
+class INPUT(ctypes.Structure):
+    """Win32 INPUT struct passed to SendInput."""
+
+    _anonymous_ = ("union",)
+    _fields_ = [
+        ("type", wintypes.DWORD),
+        ("union", _INPUTUNION),
+    ]
+
+
+# Explicit prototypes: without argtypes/restype, ctypes re-runs its
+# argument-conversion dispatch on every call, which matters on the
+# per-event SendInput path.
+#
+# SendInput is bound through a WINFUNCTYPE prototype rather than the
+# windll attribute form; the prototype call path does no errno/last-error
+# bookkeeping, and the GIL is dropped around the foreign call so the
+# pause-hotkey thread can preempt between events.
+SendInput = ctypes.WINFUNCTYPE(
+    wintypes.UINT, wintypes.UINT, ctypes.POINTER(INPUT), ctypes.c_int,
+)(("SendInput", user32))
+
+MapVirtualKeyW = user32.MapVirtualKeyW
+MapVirtualKeyW.argtypes = [wintypes.UINT, wintypes.UINT]
+MapVirtualKeyW.restype = wintypes.UINT
+
+VkKeyScanW = user32.VkKeyScanW
+VkKeyScanW.argtypes = [wintypes.WCHAR]
+VkKeyScanW.restype = ctypes.c_short
+
+SetCursorPos = user32.SetCursorPos
+SetCursorPos.argtypes = [ctypes.c_int, ctypes.c_int]
+SetCursorPos.restype = wintypes.BOOL
+
+GetCursorPos = user32.GetCursorPos
+GetCursorPos.argtypes = [ctypes.POINTER(wintypes.POINT)]
+GetCursorPos.restype = wintypes.BOOL
+
+GetSystemMetrics = user32.GetSystemMetrics
+GetSystemMetrics.argtypes = [ctypes.c_int]
+GetSystemMetrics.restype = ctypes.c_int
+
+INPUT_SIZE = ctypes.sizeof(INPUT)
+
+# Virtual-key codes for the pynput special-key strings produced by
+# MacroRecorder.normalize_key. Character keys are resolved at runtime
+# through VkKeyScanW instead.
+vk_map = {
+    "Key.alt": 0x12,
+    "Key.alt_l": 0xA4,
+    "Key.alt_r": 0xA5,
+    "Key.ctrl": 0x11,
+    "Key.ctrl_l": 0xA2,
+    "Key.ctrl_r": 0xA3,
+    "Key.shift": 0x10,
+    "Key.shift_l": 0xA0,
+    "Key.shift_r": 0xA1,
+    "Key.cmd": 0x5B,
+    "Key.cmd_l": 0x5B,
+    "Key.cmd_r": 0x5C,
+    "Key.space": 0x20,
+    "Key.enter": 0x0D,
+    "Key.tab": 0x09,
+    "Key.backspace": 0x08,
+    "Key.delete": 0x2E,
+    "Key.esc": 0x1B,
+    "Key.caps_lock": 0x14,
+    "Key.f1": 0x70,
+    "Key.f2": 0x71,
+    "Key.f3": 0x72,
+    "Key.f4": 0x73,
+    "Key.f5": 0x74,
+    "Key.f6": 0x75,
+    "Key.f7": 0x76,
+    "Key.f8": 0x77,
+    "Key.f9": 0x78,
+    "Key.f10": 0x79,
+    "Key.f11": 0x7A,
+    "Key.f12": 0x7B,
+    "Key.print_screen": 0x2C,
+    "Key.scroll_lock": 0x91,
+    "Key.pause": 0x13,
+    "Key.insert": 0x2D,
+    "Key.home": 0x24,
+    "Key.end": 0x23,
+    "Key.page_up": 0x21,
+    "Key.page_down": 0x22,
+    "Key.up": 0x26,
+    "Key.down": 0x28,
+    "Key.left": 0x25,
+    "Key.right": 0x27,
+    "Key.num_lock": 0x90,
+    "Key.keypad_0": 0x60,
+    "Key.keypad_1": 0x61,
+    "Key.keypad_2": 0x62,
+    "Key.keypad_3": 0x63,
+    "Key.keypad_4": 0x64,
+    "Key.keypad_5": 0x65,
+    "Key.keypad_6": 0x66,
+    "Key.keypad_7": 0x67,
+    "Key.keypad_8": 0x68,
+    "Key.keypad_9": 0x69,
+    "Key.keypad_add": 0x6B,
+    "Key.keypad_subtract": 0x6D,
+    "Key.keypad_multiply": 0x6A,
+    "Key.keypad_divide": 0x6F,
+    "Key.keypad_decimal": 0x6E,
+    "Key.keypad_enter": 0x0D,
+}
+
+# Keys whose scan codes require KEYEVENTF_EXTENDEDKEY.
+extended_keys = frozenset({
+    "Key.alt_r",
+    "Key.ctrl_r",
+    "Key.insert",
+    "Key.delete",
+    "Key.home",
+    "Key.end",
+    "Key.page_up",
+    "Key.page_down",
+    "Key.up",
+    "Key.down",
+    "Key.left",
+    "Key.right",
+    "Key.num_lock",
+    "Key.keypad_divide",
+    "Key.keypad_enter",
+    "Key.print_screen",
+})
+
+# MOUSEINPUT down/up flag pairs keyed by pyautogui button name.
+mouse_flag_map = {
+    "left": (MOUSEEVENTF_LEFTDOWN, MOUSEEVENTF_LEFTUP),
+    "right": (MOUSEEVENTF_RIGHTDOWN, MOUSEEVENTF_RIGHTUP),
+    "middle": (MOUSEEVENTF_MIDDLEDOWN, MOUSEEVENTF_MIDDLEUP),
+}
+
+
+def vk_for_key(key_str: str) -> int | None:
+    """
+    Resolve a normalized pynput key string to a Win32 virtual-key code.
+
+    Args:
+        key_str: Key string as recorded by MacroRecorder (e.g. "a", "Key.shift").
+
+    Returns:
+        int | None: The virtual-key code, or None if the key cannot be mapped.
+    """
+    vk = vk_map.get(key_str)
+    if vk is not None:
+        return vk
+    if len(key_str) == 1:
+        result = VkKeyScanW(key_str)
+        if result != -1:
+            return result & 0xFF
+    return None
+
+
+def cursor_pos() -> tuple[int, int]:
+    """Return the current cursor position as an (x, y) tuple."""
+    point = wintypes.POINT()
+    GetCursorPos(ctypes.byref(point))
+    return (point.x, point.y)
+
+
+def create_timer() -> int | None:
+    """
+    Create a high-resolution waitable timer.
+
+    Returns:
+        int | None: Timer handle, or None if creation failed (e.g. on
+        Windows versions without high-resolution timer support).
+    """
+    handle = kernel32.CreateWaitableTimerExW(
+        None, None, CREATE_WAITABLE_TIMER_HIGH_RESOLUTION, TIMER_ALL_ACCESS)
+    return handle or None
+
+
+def timer_sleep(handle: int, seconds: float) -> None:
+    """
+    Block for the given duration using a waitable timer.
+
+    Unlike time.sleep, this is not quantized to the OS timer period, so
+    waits in the hundreds-of-microseconds range land on target.
+
+    Args:
+        handle: Handle returned by create_timer.
+        seconds: Duration to wait.
+    """
+    # Negative due time means relative, in 100-nanosecond units.
+    due_time = wintypes.LARGE_INTEGER(-int(seconds * 1e7))
+    kernel32.SetWaitableTimer(
+        handle, ctypes.byref(due_time), 0, None, None, False)
+    kernel32.WaitForSingleObject(handle, INFINITE)
+
+
+def close_timer(handle: int) -> None:
+    """Close a waitable timer handle."""
+    kernel32.CloseHandle(handle)
+
+
+def begin_timer_period() -> None:
+    """
+    Request 1 ms OS timer resolution.
+
+    Without this, sleeps quantize to the default timer period (~15.6 ms),
+    distorting short inter-event waits. Must be paired with
+    end_timer_period.
+    """
+    winmm.timeBeginPeriod(1)
+
+
+def end_timer_period() -> None:
+    """Release the 1 ms timer-resolution request."""
+    winmm.timeEndPeriod(1)
+
+
+def screen_size() -> tuple[int, int]:
+    """Return the primary display size in pixels."""
+    return (GetSystemMetrics(SM_CXSCREEN), GetSystemMetrics(SM_CYSCREEN))
+
+
+def current_thread_id() -> int:
+    """Return the Win32 thread id of the calling thread."""
+    return kernel32.GetCurrentThreadId()
+
+
+def pump_hotkey(vk: int, callback) -> bool:
+    """
+    Register a global hotkey and pump messages until WM_QUIT.
+
+    Receives WM_HOTKEY through a plain message loop instead of a
+    WH_KEYBOARD_LL hook, so no per-keystroke callback is injected into
+    the OS hook chain. Blocks the calling thread; stop it by posting
+    WM_QUIT to the thread (see stop_pump).
+
+    Args:
+        vk: Virtual-key code of the hotkey.
+        callback: Called (with no arguments) on each hotkey press.
+
+    Returns:
+        bool: False if the hotkey could not be registered.
+    """
+    if not user32.RegisterHotKey(None, 1, 0, vk):
+        return False
+    msg = wintypes.MSG()
+    try:
+        while user32.GetMessageW(ctypes.byref(msg), None, 0, 0) > 0:
+            if msg.message == WM_HOTKEY:
+                callback()
+    finally:
+        user32.UnregisterHotKey(None, 1)
+    return True
+
+
+def stop_pump(thread_id: int) -> None:
+    """Post WM_QUIT to a thread running pump_hotkey."""
+    user32.PostThreadMessageW(thread_id, WM_QUIT, 0, 0)
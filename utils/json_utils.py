@@ -1,5 +1,6 @@
 """
-Utility functions for saving/opening recorded event data as a JSON file.
+Utility functions for saving/opening recorded event data as a JSON file,
+plus helpers for the newline-delimited autosave format.
 """
 
 import json
@@ -7,6 +8,12 @@ import logging
 from pathlib import Path
 from typing import Optional, Any
 
+try:
+    import orjson
+except ImportError:
+    # orjson is optional; the stdlib encoder is used when it is missing.
+    orjson = None
+
 logger = logging.getLogger("json_utils")
 
 
@@ -26,13 +33,85 @@ def save_file(filename: str, events: list[dict[str, Any]]) -> None:
         recordings_dir = Path.cwd() / "recordings"
         recordings_dir.mkdir(parents=True, exist_ok=True)
         filepath = recordings_dir / filename
-        with filepath.open("w", encoding="utf-8") as fp:
-            json.dump(events, fp, indent=4)
+        # Keyboard events carry no pos or scroll fields; dropping the null
+        # entries shrinks files noticeably. Playback reads fields with
+        # .get(), so absent keys load the same as nulls.
+        events = [
+            {key: value for key, value in event.items() if value is not None}
+            for event in events
+        ]
+        # Serialize in memory and write once: orjson encodes several times
+        # faster than the stdlib and a single write_bytes avoids the
+        # per-chunk passes through the text wrapper.
+        if orjson is not None:
+            payload = orjson.dumps(events, option=orjson.OPT_INDENT_2)
+        else:
+            payload = json.dumps(events, indent=4).encode("utf-8")
+        filepath.write_bytes(payload)
         logger.info("Saved as: %s", filepath)
     except (OSError, TypeError):
         logger.exception("Error saving file")
 
 
+def append_jsonl(file: Any, events: list[dict[str, Any]]) -> None:
+    """
+    Append events to an open binary file as newline-delimited JSON.
+
+    Args:
+        file: A file object opened in binary append/write mode.
+        events: List of events to serialize, one line each.
+
+    Raises:
+        OSError: If a general I/O error occurs.
+        TypeError: If an event contains an object that can't be serialized.
+    """
+    if orjson is not None:
+        payload = b"".join(orjson.dumps(event) + b"\n" for event in events)
+    else:
+        payload = "".join(
+            json.dumps(event) + "\n" for event in events
+        ).encode("utf-8")
+    file.write(payload)
+
+
+def convert_jsonl_to_json(filepath: str) -> Optional[Path]:
+    """
+    Converts a newline-delimited autosave file into the regular JSON format.
+
+    Args:
+        filepath: The string representation of the path to the .jsonl file.
+
+    Returns:
+        The path of the written .json file, or None if there's an error.
+    """
+    path = Path(filepath)
+    try:
+        with path.open("r", encoding="utf-8") as fp:
+            events = [json.loads(line) for line in fp if line.strip()]
+    except FileNotFoundError:
+        logger.warning("File not found: %s", path)
+        return None
+    except json.JSONDecodeError:
+        logger.exception("Invalid JSON in file %s", path)
+        return None
+    except OSError:
+        logger.exception("Error opening file: %s", path)
+        return None
+
+    target = path.with_suffix(".json")
+    try:
+        if orjson is not None:
+            payload = orjson.dumps(events, option=orjson.OPT_INDENT_2)
+        else:
+            payload = json.dumps(events, indent=4).encode("utf-8")
+        target.write_bytes(payload)
+    except (OSError, TypeError):
+        logger.exception("Error saving file")
+        return None
+    logger.info("Converted %s to %s", path, target)
+    return target
+
+
 def open_file(filepath: str) -> Optional[list[dict[str, Any]]]:
     """
     Opens a JSON file and returns its contents.
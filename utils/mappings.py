@@ -3,8 +3,12 @@ Key and mouse mappings from pynput input codes to pyautogui codes.
 
 Allows MacroPlayer to replay MacroRecorder's recordings.
 
+Both maps are wrapped in MappingProxyType so they are read-only views;
+lookups go through the underlying dict at full speed.
 """
 
+from types import MappingProxyType
+
 key_map = {
     "Key.alt": "alt",
     "Key.alt_l": "altleft",
@@ -66,36 +70,16 @@ key_map = {
     "Key.keypad_divide": "/",
     "Key.keypad_decimal": ".",
     "Key.keypad_enter": "enter",
-    '\u0001': 'a',
-    '\u0002': 'b',
-    '\u0003': 'c',
-    '\u0004': 'd',
-    '\u0005': 'e',
-    '\u0006': 'f',
-    '\u0007': 'g',
-    '\u0008': 'h',
-    '\u0009': 'i',
-    '\u000a': 'j',
-    '\u000b': 'k',
-    '\u000c': 'l',
-    '\u000d': 'm',
-    '\u000e': 'n',
-    '\u000f': 'o',
-    '\u0010': 'p',
-    '\u0011': 'q',
-    '\u0012': 'r',
-    '\u0013': 's',
-    '\u0014': 't',
-    '\u0015': 'u',
-    '\u0016': 'v',
-    '\u0017': 'w',
-    '\u0018': 'x',
-    '\u0019': 'y',
-    '\u001a': 'z',
 }
 
-mouse_button_map = {
+# Ctrl+letter arrives as a control character (\u0001..\u001a); build those
+# entries in one pass instead of spelling out all 26 literals.
+key_map.update({chr(i + 1): chr(ord("a") + i) for i in range(26)})
+
+key_map = MappingProxyType(key_map)
+
+mouse_button_map = MappingProxyType({
     "Button.left": "left",
     "Button.right": "right",
     "Button.middle": "middle",
-}
+})